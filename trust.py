@@ -1,12 +1,26 @@
+import abc
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import inspect
 import json
 import logging
+import os
+import queue
 import random
+import shutil
 import subprocess
-from dataclasses import dataclass
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
 from datetime import datetime
+import aiohttp
 import begin
-
-import requests
+import orjson
 from web3 import Web3
 
 logging.basicConfig(level=logging.INFO)
@@ -14,9 +28,113 @@ logger = logging.getLogger(__name__)
 
 ETHERSCAN_API_URL = "https://api.etherscan.io/api"
 COINMARKETCAP_API_URL = "https://pro-api.coinmarketcap.com/"
+BN128_PRIME = 21888242871839275222246405745257275088548364400416034343698204186575808495617
+BN128_PRIME_INV = 1.0 / BN128_PRIME
+KRATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "krates")
+VERIFIER_ABI_PATH = os.path.join(KRATES_PATH, "verifier.abi")
+CACHE_PATH = os.environ.get("ZK_TRUST_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "zk-trust"
+)
+
+
+def _h2i(value: str) -> int:
+    """
+    Parses a 0x-prefixed hex word as emitted by ZoKrates.
+    """
+    return int(value, 16)
+
+
+class TTLCache:
+    """
+    On-disk cache where every entry expires after its own TTL, so responses
+    are reused across runs of the script. Expired and malformed entries are
+    treated as misses and removed the first time this process writes.
+    """
 
+    def __init__(self, path: str):
+        self.path = path
+        self._pruned = False
 
-@dataclass
+    def _file(self, key) -> str:
+        return os.path.join(self.path, hashlib.sha256(repr(key).encode()).hexdigest() + ".json")
+
+    @staticmethod
+    def _read(path: str) -> dict | None:
+        try:
+            with open(path, "rb") as f:
+                entry = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if not isinstance(entry, dict) or "value" not in entry or not isinstance(entry.get("expires_at"), (int, float)):
+            return None
+        return entry
+
+    def get(self, key, default=None):
+        entry = self._read(self._file(key))
+        if entry is None or entry["expires_at"] < time.time():
+            return default
+        return entry["value"]
+
+    def set(self, key, value, ttl_seconds: float) -> None:
+        path = self._file(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            self.prune()
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps({"expires_at": time.time() + ttl_seconds, "value": value}))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as error:
+            logger.warning("Could not cache %s: %s", key, error)
+
+    def prune(self) -> None:
+        if self._pruned:
+            return
+        self._pruned = True
+        now = time.time()
+        for name in os.listdir(self.path):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.path, name)
+            entry = self._read(path)
+            if entry is None or entry["expires_at"] < now:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+
+_CACHE = TTLCache(CACHE_PATH)
+_MISSING = object()
+
+
+def ttl_cache(ttl: float, is_cacheable=lambda value: True, exclude: tuple[str, ...] = ()):
+    """
+    Caches the result of an async API call for `ttl` seconds, keyed by the
+    function name and its arguments except those named in `exclude`, such as
+    API keys. Results rejected by `is_cacheable`, such as rate-limit errors,
+    are not stored.
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__qualname__, tuple((name, value) for name, value in bound.arguments.items() if name not in exclude))
+            value = _CACHE.get(key, _MISSING)
+            if value is _MISSING:
+                value = await fn(*args, **kwargs)
+                if is_cacheable(value):
+                    _CACHE.set(key, value, ttl)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@dataclass(slots=True, frozen=True)
 class Proof:
     a: list[int]
     b: list[list[int]]
@@ -24,16 +142,16 @@ class Proof:
 
     def to_solidity(self) -> tuple[tuple[int, int], list[list[int]], tuple[int, int]]:
         return (
-            (int(self.a[0], 16), int(self.a[1], 16)),  # a: (uint256, uint256)
+            (self.a[0], self.a[1]),  # a: (uint256, uint256)
             [
-                [int(self.b[0][0], 16), int(self.b[0][1], 16)],  # b[0]: (uint256[2])
-                [int(self.b[1][0], 16), int(self.b[1][1], 16)],  # b[1]: (uint256[2])
+                [self.b[0][0], self.b[0][1]],  # b[0]: (uint256[2])
+                [self.b[1][0], self.b[1][1]],  # b[1]: (uint256[2])
             ],
-            (int(self.c[0], 16), int(self.c[1], 16)),  # c: (uint256, uint256)
+            (self.c[0], self.c[1]),  # c: (uint256, uint256)
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Inputs:
     score: int
     signature: int
@@ -49,11 +167,10 @@ class Inputs:
         ]
 
     def get_normalized_score(self) -> float:
-        BN128_PRIME = 21888242871839275222246405745257275088548364400416034343698204186575808495617
-        return self.score / BN128_PRIME  # Approximate floating-point representation
+        return self.score * BN128_PRIME_INV  # Approximate floating-point representation
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Computation:
     curve: str
     proof: Proof
@@ -61,7 +178,7 @@ class Computation:
     inputs: Inputs
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Stats:
     contract_address: str
     has_source_code: bool
@@ -74,18 +191,9 @@ class Stats:
     market_cap: int
 
     def to_dict(self) -> dict:
-        return {
-            "contract_address": self.contract_address,
-            "has_source_code": self.has_source_code,
-            "total_supply": self.total_supply,
-            "name": self.name,
-            "symbol": self.symbol,
-            "days_ago_added": self.days_ago_added,
-            "is_active": self.is_active,
-            "volume": self.volume,
-            "market_cap": self.market_cap,
-        }
+        return asdict(self)
 
+    @property
     def split_address(self) -> tuple[int, int]:
         """
         You may do this in Solidity:
@@ -99,14 +207,13 @@ class Stats:
             return (addressPart1, addressPart2);
         }
         """
-        size = len(self.contract_address)
-        middle = size // 2
-        address_part1 = int(self.contract_address[:middle], 16)
-        address_part2 = int(self.contract_address[middle:], 16)
+        address = int(self.contract_address, 16)
+        address_part1 = address >> 80
+        address_part2 = address & ((1 << 80) - 1)
         return address_part1, address_part2
 
     def to_zkvm_input(self) -> list[int]:
-        address_part1, address_part2 = self.split_address()
+        address_part1, address_part2 = self.split_address
         return [
             address_part1,
             address_part2,
@@ -118,39 +225,66 @@ class Stats:
             int(self.has_source_code),
         ]
 
-    def compute(self) -> Computation:
+    async def compute(self) -> Computation:
         params = self.to_zkvm_input()
-        return Docker.run_compute_witness(params)
+        return await ZOKRATES_BACKEND.run_compute_witness(params)
+
+
+class HTTP:
+    _session: aiohttp.ClientSession | None = None
+
+    @classmethod
+    def session(cls) -> aiohttp.ClientSession:
+        """
+        Returns the client session shared by all API calls, so connections
+        are kept alive and reused across requests.
+        """
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, limit_per_host=8, ttl_dns_cache=300),
+                headers={"Accepts": "application/json"},
+            )
+        return cls._session
+
+    @classmethod
+    async def close(cls) -> None:
+        session, cls._session = cls._session, None
+        if session is not None:
+            await session.close()
 
 
 class CoinMarketCap:
     @staticmethod
-    def get_token_metadata(contract_address: str, coinmarketcap_api_key: str) -> dict:
-        headers = {
-            "Accepts": "application/json",
-            "X-CMC_PRO_API_KEY": coinmarketcap_api_key,
-        }
+    def is_ok(payload: dict) -> bool:
+        return payload.get("status", {}).get("error_code") == 0
+
+    @staticmethod
+    @ttl_cache(ttl=3600, is_cacheable=is_ok, exclude=("coinmarketcap_api_key",))
+    async def get_token_metadata(contract_address: str, coinmarketcap_api_key: str) -> dict:
+        headers = {"X-CMC_PRO_API_KEY": coinmarketcap_api_key}
         parameters = {"address": contract_address}
-        logger.info(f"Getting token metadata for {contract_address}")
-        response = requests.get(COINMARKETCAP_API_URL + "v2/cryptocurrency/info", headers=headers, params=parameters)
-        logger.info(f"Response: {response.json()}")
-        return response.json()
+        logger.info("Getting token metadata for %s", contract_address)
+        async with HTTP.session().get(COINMARKETCAP_API_URL + "v2/cryptocurrency/info", headers=headers, params=parameters) as response:
+            payload = orjson.loads(await response.read())
+        logger.info("Response: %s", payload)
+        return payload
 
     @staticmethod
-    def get_token_market_data(token_id: str, coinmarketcap_api_key: str) -> dict:
-        headers = {
-            "Accepts": "application/json",
-            "X-CMC_PRO_API_KEY": coinmarketcap_api_key,
-        }
+    @ttl_cache(ttl=60, is_cacheable=is_ok, exclude=("coinmarketcap_api_key",))
+    async def get_token_market_data(token_id: str, coinmarketcap_api_key: str) -> dict:
+        headers = {"X-CMC_PRO_API_KEY": coinmarketcap_api_key}
         parameters = {
             "id": token_id,
             "time_start": "2024-01-01",
             "time_end": "2025-02-15",
             "interval": "365d",
         }
-        logger.info(f"Getting token market data for {token_id}")
-        response = requests.get(COINMARKETCAP_API_URL + "v2/cryptocurrency/quotes/historical", headers=headers, params=parameters)
-        logger.info(f"Response: {response.json()}")
+        logger.info("Getting token market data for %s", token_id)
+        async with HTTP.session().get(COINMARKETCAP_API_URL + "v2/cryptocurrency/quotes/historical", headers=headers, params=parameters) as response:
+            body = await response.read()
+        # The response is only logged, so skip decoding it when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Response: %s", orjson.loads(body))
         # NOTE: This requires a paid plan, so we'll just return mock data for now
         return {
             "data": {
@@ -181,108 +315,355 @@ class CoinMarketCap:
 
 class Etherscan:
     @staticmethod
-    def get_contract_details(contract_address: str, etherscan_api_key: str) -> dict:
-        logger.info(f"Getting contract details for {contract_address}")
+    def is_ok(payload: dict) -> bool:
+        # Errors such as rate limits come back as HTTP 200 with status "0" and message "NOTOK"
+        return payload.get("status") == "1"
+
+    @staticmethod
+    @ttl_cache(ttl=86400, is_cacheable=is_ok, exclude=("etherscan_api_key",))
+    async def get_contract_details(contract_address: str, etherscan_api_key: str) -> dict:
+        logger.info("Getting contract details for %s", contract_address)
         params = {"module": "contract", "action": "getsourcecode", "address": contract_address, "apikey": etherscan_api_key}
-        response = requests.get(ETHERSCAN_API_URL, params=params)
-        logger.info(f"Response: {response.json()}")
-        return response.json()
+        async with HTTP.session().get(ETHERSCAN_API_URL, params=params) as response:
+            payload = orjson.loads(await response.read())
+        logger.info("Response: %s", payload)
+        return payload
 
     @staticmethod
-    def get_erc20_total_supply(contract_address: str, etherscan_api_key: str) -> dict:
-        logger.info(f"Getting ERC20 total supply for {contract_address}")
+    @ttl_cache(ttl=60, is_cacheable=is_ok, exclude=("etherscan_api_key",))
+    async def get_erc20_total_supply(contract_address: str, etherscan_api_key: str) -> dict:
+        logger.info("Getting ERC20 total supply for %s", contract_address)
         params = {"module": "stats", "action": "tokensupply", "contractaddress": contract_address, "apikey": etherscan_api_key}
-        response = requests.get(ETHERSCAN_API_URL, params=params)
-        logger.info(f"Response: {response.json()}")
-        return response.json()
+        async with HTTP.session().get(ETHERSCAN_API_URL, params=params) as response:
+            payload = orjson.loads(await response.read())
+        logger.info("Response: %s", payload)
+        return payload
 
 
-class Docker:
-    @staticmethod
-    def get_zokrates_container_name():
-        result = subprocess.run(["docker", "ps"], capture_output=True, text=True)
-        if result.returncode != 0 or not result.stdout.strip():
-            raise RuntimeError("❌ No running ZoKrates container found. Start ZoKrates first!")
-        containers = result.stdout.strip().split("\n")
-        for line in containers:
-            logger.info(f"Container line: {line}")
-            if "zokrates" in line.lower():
-                return line.split()[-1]
-        raise RuntimeError("❌ No running ZoKrates container found. Start ZoKrates first!")
+class ZokratesBackend(abc.ABC):
+    """
+    Strategy for running ZoKrates: natively when the zokrates binary is on the
+    PATH, otherwise inside a Docker container.
+    """
 
     @staticmethod
-    def run_compute_witness(params: list[int]) -> Computation:
-        container_name = Docker.get_zokrates_container_name()
-        cmd = [
-            "docker",
-            "exec",
-            "-it",
-            container_name,
-            "bash",
-            "-c",
-            f"cd /home/zokrates/krates && zokrates compute-witness -a {' '.join(map(str, params))} && zokrates generate-proof",
-        ]
-        logger.info(f"Running command: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            logger.error(f"❌ Error in compute-witness:\n{result.stderr}")
-            raise RuntimeError("ZoKrates compute-witness failed!")
-        logger.info(f"✅ ZoKrates compute-witness output:\n{result.stdout}")
-        return Docker.get_results()
+    def select() -> "ZokratesBackend":
+        return Zokrates() if shutil.which("zokrates") else Docker()
+
+    @abc.abstractmethod
+    async def run_compute_witness(self, params: list[int]) -> Computation:
+        """
+        Computes the witness and proof for the given circuit inputs.
+        """
+
+    def close(self) -> None:
+        """
+        Releases whatever the backend keeps running between computations.
+        """
 
     @staticmethod
-    def get_results() -> Computation:
-        container_name = Docker.get_zokrates_container_name()
-        cmd = ["docker", "exec", "-it", container_name, "bash", "-c", "cd /home/zokrates/krates && cat proof.json"]
-        logger.info(f"Running command: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            logger.error(f"❌ Error in get-calculation:\n{result.stderr}")
-            raise RuntimeError("ZoKrates get-calculation failed!")
-        logger.info(f"✅ ZoKrates get-calculation output:\n{result.stdout}")
-        results = json.loads(result.stdout)
+    def parse_proof(results: dict) -> Computation:
+        # Parse every hex word once, in order: a, b[0], b[1], c, inputs
+        words = [
+            *results["proof"]["a"],
+            *results["proof"]["b"][0],
+            *results["proof"]["b"][1],
+            *results["proof"]["c"],
+            *results["inputs"][:4],
+        ]
+        values = [_h2i(word) for word in words]
         return Computation(
             curve=results["curve"],
             proof=Proof(
-                a=results["proof"]["a"],
-                b=results["proof"]["b"],
-                c=results["proof"]["c"],
+                a=values[0:2],
+                b=[values[2:4], values[4:6]],
+                c=values[6:8],
             ),
             scheme=results["scheme"],
             inputs=Inputs(
-                score=int(results["inputs"][0], 16),
-                signature=int(results["inputs"][1], 16),
-                address_part1=int(results["inputs"][2], 16),
-                address_part2=int(results["inputs"][3], 16),
+                score=values[8],
+                signature=values[9],
+                address_part1=values[10],
+                address_part2=values[11],
             ),
         )
 
 
+class Zokrates(ZokratesBackend):
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    async def run_compute_witness(self, params: list[int]) -> Computation:
+        return await asyncio.to_thread(self._generate_proof, params)
+
+    def _generate_proof(self, params: list[int]) -> Computation:
+        # All runs share the krates directory, so only one may write proof.json at a time
+        with self._lock:
+            self._run(["zokrates", "compute-witness", "-a", *map(str, params)], "compute-witness")
+            self._run(["zokrates", "generate-proof"], "generate-proof")
+            with open(os.path.join(KRATES_PATH, "proof.json"), "rb") as f:
+                return self.parse_proof(orjson.loads(f.read()))
+
+    @staticmethod
+    def _run(cmd: list[str], step: str) -> None:
+        logger.info("Running command: %s", " ".join(cmd))
+        result = subprocess.run(cmd, cwd=KRATES_PATH, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        if result.returncode != 0:
+            logger.error("❌ Error in %s:\n%s", step, result.stdout.decode(errors="replace"))
+            raise RuntimeError(f"ZoKrates {step} failed!")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ ZoKrates %s output:\n%s", step, result.stdout.decode(errors="replace"))
+
+
+class ZokratesPool:
+    """
+    Queue of running ZoKrates containers.
+
+    Each computation takes a container out of the queue and puts it back once
+    it is done, so concurrent computations never share a container. Every
+    pooled container needs its own krates directory, since ZoKrates writes the
+    witness and proof.json next to the compiled program.
+    """
+
+    def __init__(self, container_names: list[str]):
+        self.container_names = container_names
+        self._queue: queue.Queue[str] = queue.Queue()
+        for container_name in container_names:
+            self._queue.put(container_name)
+
+    @contextlib.contextmanager
+    def acquire(self) -> Iterator[str]:
+        container_name = self._queue.get()
+        try:
+            yield container_name
+        finally:
+            self._queue.put(container_name)
+
+
+class Docker(ZokratesBackend):
+    KRATES_DIR = "/home/zokrates/krates"
+    SENTINEL = "__DONE__"
+    PROOF_MARKER = "---PROOF---"
+    POOL_LABEL = "zokrates"
+
+    def __init__(self):
+        self._pool: ZokratesPool | None = None
+        self._processes: dict[str, subprocess.Popen] = {}
+
+    @staticmethod
+    async def list_containers() -> list[tuple[str, str, str]]:
+        """
+        Returns the name, image and role label of every running container.
+        """
+        process = await asyncio.create_subprocess_exec(
+            "docker",
+            "ps",
+            "--format",
+            '{{.Names}}\t{{.Image}}\t{{.Label "role"}}',
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError("❌ Cannot reach the Docker daemon. Start Docker or set ZOKRATES_CONTAINER!")
+        return [tuple((line.split("\t") + ["", ""])[:3]) for line in stdout.decode().strip().splitlines()]
+
+    @staticmethod
+    async def get_zokrates_container_names() -> list[str]:
+        """
+        Returns the containers listed in ZOKRATES_CONTAINER (comma separated),
+        or else every running container labelled role=zokrates, or else the
+        first running container whose name or image mentions zokrates.
+        """
+        names = os.environ.get("ZOKRATES_CONTAINER")
+        if names:
+            return [name.strip() for name in names.split(",") if name.strip()]
+        labelled, matched = [], []
+        for name, image, role in await Docker.list_containers():
+            logger.info("Container: %s (%s)", name, image)
+            if role == Docker.POOL_LABEL:
+                labelled.append(name)
+            elif "zokrates" in name.lower() or "zokrates" in image.lower():
+                matched.append(name)
+        if not labelled and not matched:
+            raise RuntimeError("❌ No running ZoKrates container found. Start ZoKrates first!")
+        return labelled or matched[:1]
+
+    async def pool(self) -> ZokratesPool:
+        if self._pool is None:
+            container_names = await self.get_zokrates_container_names()
+            if self._pool is None:
+                self._pool = ZokratesPool(container_names)
+                logger.info("ZoKrates pool: %s", ", ".join(self._pool.container_names))
+        return self._pool
+
+    def _worker(self, container_name: str) -> subprocess.Popen:
+        """
+        Returns a long-lived bash shell inside the given ZoKrates container.
+
+        Commands are written to its stdin and their output is read back from
+        its stdout until the sentinel line, so the container is attached once
+        instead of once per command.
+        """
+        process = self._processes.get(container_name)
+        if process is not None and process.poll() is None:
+            return process
+        cmd = ["docker", "exec", "-i", container_name, "bash"]
+        logger.info("Starting ZoKrates worker: %s", " ".join(cmd))
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        self._processes[container_name] = process
+        return process
+
+    def close(self) -> None:
+        processes, self._processes = self._processes, {}
+        for process in processes.values():
+            if process.poll() is not None:
+                continue
+            process.stdin.close()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.terminate()
+
+    def _discard(self, container_name: str, process: subprocess.Popen) -> None:
+        # A worker whose output was not fully read would hand leftovers to the next command
+        if self._processes.get(container_name) is process:
+            del self._processes[container_name]
+        process.kill()
+        process.wait()
+
+    def _exec(self, container_name: str, command: str, step: str) -> bytes:
+        worker = self._worker(container_name)
+        logger.info("Running command on %s: %s", container_name, command)
+        sentinel = f"{self.SENTINEL}{uuid.uuid4().hex}:"
+        try:
+            worker.stdin.write(f"{command}\nprintf '\\n{sentinel}%s\\n' $?\n".encode())
+            worker.stdin.flush()
+            lines = []
+            for line in worker.stdout:
+                if line.startswith(sentinel.encode()):
+                    returncode = int(line[len(sentinel) :])
+                    break
+                lines.append(line)
+            else:
+                raise RuntimeError(f"ZoKrates worker exited during {step}!")
+        except BaseException:
+            self._discard(container_name, worker)
+            raise
+        output = b"".join(lines)
+        if returncode != 0:
+            logger.error("❌ Error in %s:\n%s", step, output.decode(errors="replace"))
+            raise RuntimeError(f"ZoKrates {step} failed!")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ ZoKrates %s output:\n%s", step, output.decode(errors="replace"))
+        return output
+
+    async def run_compute_witness(self, params: list[int]) -> Computation:
+        pool = await self.pool()
+        return await asyncio.to_thread(self._generate_proof, pool, params)
+
+    def _generate_proof(self, pool: ZokratesPool, params: list[int]) -> Computation:
+        with pool.acquire() as container_name:
+            command = (
+                f"cd {Docker.KRATES_DIR}"
+                f" && zokrates compute-witness -a {' '.join(map(str, params))}"
+                f" && zokrates generate-proof >/dev/null"
+                f" && printf '\\n{Docker.PROOF_MARKER}\\n' && cat proof.json"
+            )
+            output = self._exec(container_name, command, "compute-witness")
+        return self.get_results(output)
+
+    @staticmethod
+    def get_results(output: bytes) -> Computation:
+        _, _, proof = output.rpartition(f"\n{Docker.PROOF_MARKER}\n".encode())
+        return Docker.parse_proof(orjson.loads(proof))
+
+
+ZOKRATES_BACKEND = ZokratesBackend.select()
+atexit.register(ZOKRATES_BACKEND.close)
+
+
 class Contract:
     @staticmethod
+    @functools.cache
     def get_abi() -> dict:
-        with open("krates/verifier.abi", "r") as f:
-            return json.load(f)
+        with open(VERIFIER_ABI_PATH, "rb") as f:
+            return orjson.loads(f.read())
 
     @staticmethod
     def verify(inputs: Inputs, proof: Proof, private_key: str, verifier_contract_address: str, ethereum_rpc_url: str) -> bool:
         w3 = Web3(Web3.HTTPProvider(ethereum_rpc_url))
         contract = w3.eth.contract(address=verifier_contract_address, abi=Contract.get_abi())
-        logger.info(f"Verifying proof with inputs: {inputs} and proof: {proof}")
-        tx = contract.functions.verifyTx(proof.to_solidity(), inputs.to_solidity()).build_transaction(
+        logger.info("Verifying proof with inputs: %s and proof: %s", inputs, proof)
+        verify_tx = contract.functions.verifyTx(proof.to_solidity(), inputs.to_solidity())
+        account = w3.eth.accounts[0]
+        with w3.batch_requests() as batch:
+            batch.add(w3.eth.get_transaction_count(account))
+            batch.add(w3.eth.gas_price)
+            nonce, gas_price = batch.execute()
+        tx = verify_tx.build_transaction(
             {
-                "from": w3.eth.accounts[0],
+                "from": account,
                 "gas": 500000,
-                "gasPrice": w3.to_wei("10", "gwei"),
-                "nonce": w3.eth.get_transaction_count(w3.eth.accounts[0]),
+                "gasPrice": gas_price,
+                "nonce": nonce,
             }
         )
         signed_tx = w3.eth.account.sign_transaction(tx, private_key=private_key)
         tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-        logger.info(f"Receipt: {receipt}")
-        logger.info(f"✅ Transaction successful: {tx_hash.hex()}")
-        return contract.functions.verifyTx(proof.to_solidity(), inputs.to_solidity()).call()
+        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120, poll_latency=0.05)
+        logger.info("Receipt: %s", receipt)
+        logger.info("✅ Transaction successful: %s", tx_hash.hex())
+        return verify_tx.call()
+
+
+async def get_stats(target_contract_address: str, etherscan_api_key: str, coinmarketcap_api_key: str) -> Stats:
+    try:
+        # First, get the token metadata, contract details and total supply concurrently
+        coinbase_details, contract_details, total_supply_details = await asyncio.gather(
+            CoinMarketCap.get_token_metadata(target_contract_address, coinmarketcap_api_key),
+            Etherscan.get_contract_details(target_contract_address, etherscan_api_key),
+            Etherscan.get_erc20_total_supply(target_contract_address, etherscan_api_key),
+        )
+        print("Coinbase metadata:")
+        print(orjson.dumps(coinbase_details, option=orjson.OPT_INDENT_2).decode())
+        print("Contract details:")
+        print(orjson.dumps(contract_details, option=orjson.OPT_INDENT_2).decode())
+        print("Get ERC20 token total supply:")
+        print(orjson.dumps(total_supply_details, option=orjson.OPT_INDENT_2).decode())
+
+        # Then, get the CoinMarketCap ID
+        coinmarketcap_id = list(coinbase_details["data"].keys())[0]
+        print("CoinMarketCap ID:", coinmarketcap_id)
+
+        # Then, get the CoinMarketCap market data
+        print("CoinMarketCap market data:")
+        coinmarketcap_market_data = await CoinMarketCap.get_token_market_data(coinmarketcap_id, coinmarketcap_api_key)
+        print(orjson.dumps(coinmarketcap_market_data, option=orjson.OPT_INDENT_2).decode())
+
+        # Then, get the date added
+        date_added = coinbase_details["data"][coinmarketcap_id]["date_added"]
+        days_ago_added = (datetime.now() - datetime.strptime(date_added, "%Y-%m-%dT%H:%M:%S.%fZ")).days
+
+        # Then, get the stats
+        return Stats(
+            contract_address=target_contract_address,
+            has_source_code=contract_details["result"][0]["SourceCode"] is not None if contract_details["result"] else False,
+            is_active=coinmarketcap_market_data["data"]["is_active"],
+            volume=coinmarketcap_market_data["data"]["quotes"][0]["quote"]["USD"]["volume_24h"],
+            market_cap=coinmarketcap_market_data["data"]["quotes"][0]["quote"]["USD"]["market_cap"],
+            total_supply=int(total_supply_details["result"]),
+            name=coinbase_details["data"][coinmarketcap_id]["name"],
+            symbol=coinbase_details["data"][coinmarketcap_id]["symbol"],
+            days_ago_added=days_ago_added,
+        )
+    finally:
+        await HTTP.close()
 
 
 @begin.start
@@ -301,59 +682,23 @@ def main(
     assert verifier_contract_address, "Verifier contract address is required"
     assert ethereum_rpc_url, "Ethereum RPC URL is required"
 
-    # First, get the token metadata
-    print("Coinbase metadata:")
-    coinbase_details = CoinMarketCap.get_token_metadata(target_contract_address, coinmarketcap_api_key)
-    print(json.dumps(coinbase_details, indent=4))
-
-    # Then, get the CoinMarketCap ID
-    coinmarketcap_id = list(coinbase_details["data"].keys())[0]
-    print("CoinMarketCap ID:", coinmarketcap_id)
-
-    # Then, get the CoinMarketCap market data
-    print("CoinMarketCap market data:")
-    coinmarketcap_market_data = CoinMarketCap.get_token_market_data(coinmarketcap_id, coinmarketcap_api_key)
-    print(json.dumps(coinmarketcap_market_data, indent=4))
-
-    # Then, get the contract details
-    print("Contract details:")
-    contract_details = Etherscan.get_contract_details(target_contract_address, etherscan_api_key)
-    print(json.dumps(contract_details, indent=4))
-
-    # Then, get the ERC20 token total supply
-    print("Get ERC20 token total supply:")
-    total_supply_details = Etherscan.get_erc20_total_supply(target_contract_address, etherscan_api_key)
-    print(json.dumps(total_supply_details, indent=4))
-
-    # Then, get the date added
-    date_added = coinbase_details["data"][coinmarketcap_id]["date_added"]
-    days_ago_added = (datetime.now() - datetime.strptime(date_added, "%Y-%m-%dT%H:%M:%S.%fZ")).days
-
-    # Then, get the stats
-    stats = Stats(
-        contract_address=target_contract_address,
-        has_source_code=contract_details["result"][0]["SourceCode"] is not None if contract_details["result"] else False,
-        is_active=coinmarketcap_market_data["data"]["is_active"],
-        volume=coinmarketcap_market_data["data"]["quotes"][0]["quote"]["USD"]["volume_24h"],
-        market_cap=coinmarketcap_market_data["data"]["quotes"][0]["quote"]["USD"]["market_cap"],
-        total_supply=int(total_supply_details["result"]),
-        name=coinbase_details["data"][coinmarketcap_id]["name"],
-        symbol=coinbase_details["data"][coinmarketcap_id]["symbol"],
-        days_ago_added=days_ago_added,
-    )
+    # First, collect the token stats
+    stats = asyncio.run(get_stats(target_contract_address, etherscan_api_key, coinmarketcap_api_key))
+    # orjson rejects integers wider than 64 bits, such as most ERC20 total supplies
     print(json.dumps(stats.to_dict(), indent=4))
 
     # Then, compute the score
     print("Calculating score...")
-    computation = stats.compute()
+    computation = asyncio.run(stats.compute())
     print(f"Calculation: {computation}")
 
     # Now, verify the score and its signature together with the zk proof
+    address_part1, address_part2 = stats.split_address
     other_inputs = Inputs(
         score=computation.inputs.score,
         signature=computation.inputs.signature,
-        address_part1=stats.split_address()[0],
-        address_part2=stats.split_address()[1],
+        address_part1=address_part1,
+        address_part2=address_part2,
     )
     receipt = Contract.verify(other_inputs, computation.proof, private_key, verifier_contract_address, ethereum_rpc_url)
 